@@ -40,22 +40,212 @@ $secretPattern = '(key|secret|token|auth|password|credential|bearer)\s*[:=]\s*["
 $logicPattern  = '(isAdmin|isAuthorized|hasPermission|userRole|enableDebugMode)\s*[:=]\s*(true|false|1|0)'
 $todoPattern   = '//\s*(TODO|FIXME|TEMP|DEBUG|BYPASS|HACK):.*'
 
-# 4. EXECUTE EXTRACTION
+# 4. LOAD THE INCREMENTAL CACHE
+# Findings are cached per source, keyed by a SHA-256 of that source's content.
+# On re-audits only new or changed sources are regex-scanned. Cached findings
+# are discarded if the search patterns above change (the per-map baselines are
+# kept), and anything unseen for $cacheMaxAgeDays is pruned so the file doesn't
+# grow forever.
+$cacheFile       = Join-Path (Get-Location) ".sourcemap-audit-cache.json"
+$cacheVersion    = 2
+$cacheMaxAgeDays = 90
+$today           = (Get-Date).ToString("yyyy-MM-dd")
+$sha256          = [System.Security.Cryptography.SHA256]::Create()
+
+function Get-ContentHash([string]$text) {
+    $bytes = [System.Text.Encoding]::UTF8.GetBytes($text)
+    return ([System.BitConverter]::ToString($sha256.ComputeHash($bytes))) -replace '-', ''
+}
+
+$patternHash = Get-ContentHash (@($routePattern, $cloudPattern, $secretPattern, $logicPattern, $todoPattern) -join "`n")
+$cacheEntries = @{}
+$baselines    = @{}
+
+# Findings are always stored as plain [string[]]. Arrays passed back through
+# a function pipeline can pick up a PSObject wrapper that Windows PowerShell
+# 5.1 serialises as {"value":[...],"Count":n} instead of a JSON array.
+function New-CacheEntry($paths, $secrets, $logic, $todos, $lastSeen) {
+    return [pscustomobject]@{
+        paths    = [string[]]@(foreach ($v in $paths) { $v })
+        secrets  = [string[]]@(foreach ($v in $secrets) { $v })
+        logic    = [string[]]@(foreach ($v in $logic) { $v })
+        todos    = [string[]]@(foreach ($v in $todos) { $v })
+        lastSeen = $lastSeen
+    }
+}
+
+if (Test-Path $cacheFile) {
+    try {
+        $stored = Get-Content $cacheFile -Raw | ConvertFrom-Json
+        foreach ($p in $stored.baselines.PSObject.Properties) {
+            $b = $p.Value
+            $baselines[$p.Name] = [pscustomobject]@{
+                date      = $b.date
+                endpoints = [string[]]@(foreach ($v in $b.endpoints) { $v })
+                secrets   = [string[]]@(foreach ($v in $b.secrets) { $v })
+            }
+        }
+        if ($stored.version -eq $cacheVersion -and $stored.patternHash -eq $patternHash) {
+            foreach ($p in $stored.entries.PSObject.Properties) {
+                $e = $p.Value
+                $cacheEntries[$p.Name] = New-CacheEntry $e.paths $e.secrets $e.logic $e.todos $e.lastSeen
+            }
+            Write-Host "[+] Loaded audit cache: $($cacheEntries.Count) known sources" -ForegroundColor Gray
+        } else {
+            Write-Host "[!] Search patterns or cache format changed. Rescanning all sources..." -ForegroundColor Yellow
+            Write-Host "    Changes since last run will include differences caused by the new patterns." -ForegroundColor Yellow
+        }
+    } catch {
+        Write-Host "[!] Warning: Audit cache is unreadable. Rebuilding..." -ForegroundColor Yellow
+    }
+}
+
+# Hashed bundle names (main.3f9a2b1c.js.map) change every build, so the
+# "since last run" baseline is keyed by the name with the hash stripped. Only a
+# mixed letter/digit segment right before the extension counts as a hash, so
+# names like "-facade" or "-20241019" survive. The map's folder and its "file"
+# field are part of the key to keep different apps apart.
+function Remove-BundleHash([string]$name) {
+    return $name -replace '[.-](?=[0-9a-z]*[0-9])(?=[0-9a-z]*[a-z])[0-9a-z]{6,}(?=(\.chunk)?\.(js|mjs|cjs|css)(\.map)?$)', ''
+}
+
+$mapFileField = ""
+if ($null -ne $mapJson -and $mapJson.file) { $mapFileField = Remove-BundleHash ([string]$mapJson.file) }
+$mapFolder    = Split-Path (Resolve-Path $jsMapFile).Path -Parent
+$baselineKey  = ("$mapFolder|$(Remove-BundleHash (Split-Path $jsMapFile -Leaf))|$mapFileField").ToLower()
+$baselineName = Remove-BundleHash (Split-Path $jsMapFile -Leaf)
+
+# 5. EXECUTE EXTRACTION
 Write-Host "[+] Running Regex Scan for High-Impact Leaks..." -ForegroundColor Cyan
 
-$allPaths = Select-String -Path $jsMapFile -Pattern "$routePattern|$cloudPattern" -AllMatches | 
-            ForEach-Object { $_.Matches | ForEach-Object { $_.Value } } | Sort-Object -Unique
+$regexOptions = [System.Text.RegularExpressions.RegexOptions]'IgnoreCase, Compiled'
+$pathRegex    = [regex]::new("$routePattern|$cloudPattern", $regexOptions)
+$secretRegex  = [regex]::new($secretPattern, $regexOptions)
+$logicRegex   = [regex]::new($logicPattern, $regexOptions)
+$todoRegex    = [regex]::new($todoPattern, $regexOptions)
+
+function Get-RegexValues($regex, [string]$text) {
+    $values = foreach ($m in $regex.Matches($text)) { $m.Value }
+    return $values | Sort-Object -Unique
+}
+
+# Each embedded source is scanned (and cached) on its own, decoded from its
+# JSON string. The remaining top-level fields form one extra unit (mappings is
+# skipped, it's VLQ noise). Without sourcesContent the raw map is one unit.
+# The units after the first $sourceUnitCount aren't sources and are reported
+# separately.
+$scanUnits = [System.Collections.Generic.List[string]]::new()
+$extraUnitLabel = "Map metadata"
+if ($isSourceExposed -eq $true) {
+    foreach ($src in $mapJson.sourcesContent) {
+        if ($null -ne $src) { $scanUnits.Add([string]$src) }
+    }
+    $sourceUnitCount = $scanUnits.Count
+    $mapFields = foreach ($field in $mapJson.PSObject.Properties) {
+        if ($field.Name -notin @("sourcesContent", "mappings")) { "$($field.Name): $($field.Value -join "`n")" }
+    }
+    $scanUnits.Add(($mapFields -join "`n"))
+} elseif ($null -ne $mapContent) {
+    $sourceUnitCount = 0
+    $extraUnitLabel  = "Whole map"
+    $scanUnits.Add($mapContent)
+}
+
+$allPaths = [System.Collections.Generic.List[object]]::new()
+$secrets  = [System.Collections.Generic.List[object]]::new()
+$logic    = [System.Collections.Generic.List[object]]::new()
+$todos    = [System.Collections.Generic.List[object]]::new()
+$scannedCount = 0; $reusedCount = 0; $extraUnitStatus = "rescanned"
+
+# The map couldn't be loaded into memory at all: stream it through
+# Select-String as before. Nothing is cached and the baseline is left alone.
+$isStreamingScan = $null -eq $mapContent
+
+if ($isStreamingScan) {
+    Write-Host "[!] Map not loaded. Streaming Regex scan without cache..." -ForegroundColor Yellow
+
+    $allPaths = Select-String -Path $jsMapFile -Pattern "$routePattern|$cloudPattern" -AllMatches |
+                ForEach-Object { $_.Matches | ForEach-Object { $_.Value } }
 
-$secrets  = Select-String -Path $jsMapFile -Pattern $secretPattern -AllMatches | 
-            ForEach-Object { $_.Matches | ForEach-Object { $_.Value } } | Sort-Object -Unique
+    $secrets  = Select-String -Path $jsMapFile -Pattern $secretPattern -AllMatches |
+                ForEach-Object { $_.Matches | ForEach-Object { $_.Value } }
 
-$logic    = Select-String -Path $jsMapFile -Pattern "$logicPattern" -AllMatches | 
-            ForEach-Object { $_.Matches | ForEach-Object { $_.Value } } | Sort-Object -Unique
+    $logic    = Select-String -Path $jsMapFile -Pattern "$logicPattern" -AllMatches |
+                ForEach-Object { $_.Matches | ForEach-Object { $_.Value } }
 
-$todos    = Select-String -Path $jsMapFile -Pattern $todoPattern -AllMatches | 
-            ForEach-Object { $_.Matches | ForEach-Object { $_.Value } } | Sort-Object -Unique
+    $todos    = Select-String -Path $jsMapFile -Pattern $todoPattern -AllMatches |
+                ForEach-Object { $_.Matches | ForEach-Object { $_.Value } }
+}
+
+for ($i = 0; $i -lt $scanUnits.Count; $i++) {
+    $unit     = $scanUnits[$i]
+    $isSource = $i -lt $sourceUnitCount
+    $hash     = Get-ContentHash $unit
+    $entry    = $cacheEntries[$hash]
+    if ($null -ne $entry) {
+        if ($isSource) { $reusedCount++ } else { $extraUnitStatus = "reused" }
+        $entry.lastSeen = $today
+    } else {
+        if ($isSource) { $scannedCount++ }
+        $entry = New-CacheEntry (Get-RegexValues $pathRegex $unit) (Get-RegexValues $secretRegex $unit) `
+                                (Get-RegexValues $logicRegex $unit) (Get-RegexValues $todoRegex $unit) $today
+        $cacheEntries[$hash] = $entry
+    }
+    foreach ($v in $entry.paths)   { $allPaths.Add($v) }
+    foreach ($v in $entry.secrets) { $secrets.Add($v) }
+    foreach ($v in $entry.logic)   { $logic.Add($v) }
+    foreach ($v in $entry.todos)   { $todos.Add($v) }
+}
+
+$allPaths = @($allPaths | Sort-Object -Unique)
+$secrets  = @($secrets  | Sort-Object -Unique)
+$logic    = @($logic    | Sort-Object -Unique)
+$todos    = @($todos    | Sort-Object -Unique)
+
+if (-not $isStreamingScan) {
+    Write-Host "[+] Sources scanned: $scannedCount | Reused from cache: $reusedCount | $($extraUnitLabel): $extraUnitStatus" -ForegroundColor Gray
+}
+
+# 6. DIFF AGAINST THE PREVIOUS RUN
+$previous = $null
+if (-not $isStreamingScan) { $previous = $baselines[$baselineKey] }
+if ($null -ne $previous) {
+    $newPaths       = @($allPaths | Where-Object { $previous.endpoints -notcontains $_ })
+    $newSecrets     = @($secrets  | Where-Object { $previous.secrets -notcontains $_ })
+    $removedPaths   = @($previous.endpoints | Where-Object { $allPaths -notcontains $_ })
+    $removedSecrets = @($previous.secrets   | Where-Object { $secrets -notcontains $_ })
+}
+
+# 7. SAVE THE CACHE
+$cutoff = (Get-Date).AddDays(-$cacheMaxAgeDays).ToString("yyyy-MM-dd")
+$keptEntries = @{}
+foreach ($hash in $cacheEntries.Keys) {
+    if ($cacheEntries[$hash].lastSeen -ge $cutoff) { $keptEntries[$hash] = $cacheEntries[$hash] }
+}
+if (-not $isStreamingScan) {
+    $baselines[$baselineKey] = [pscustomobject]@{ date = $today; endpoints = [string[]]$allPaths; secrets = [string[]]$secrets }
+}
+$keptBaselines = @{}
+foreach ($key in $baselines.Keys) {
+    if ($baselines[$key].date -ge $cutoff) { $keptBaselines[$key] = $baselines[$key] }
+}
+
+# Written to a temp file and swapped in, so a crash mid-write can't leave a
+# truncated cache that the next run would have to throw away.
+$cacheTempFile = "$cacheFile.tmp"
+try {
+    [pscustomobject]@{
+        version     = $cacheVersion
+        patternHash = $patternHash
+        entries     = $keptEntries
+        baselines   = $keptBaselines
+    } | ConvertTo-Json -Depth 5 -Compress | Out-File -FilePath $cacheTempFile -Encoding utf8
+    Move-Item -Path $cacheTempFile -Destination $cacheFile -Force
+} catch {
+    Write-Host "[!] Warning: Could not write audit cache: $($_.Exception.Message)" -ForegroundColor Yellow
+}
 
-# 5. GENERATE THE SUMMARY
+# 8. GENERATE THE SUMMARY
 Write-Host "`n====================================================" -ForegroundColor Yellow
 Write-Host "                ANALYSIS SUMMARY                    " -ForegroundColor Yellow
 Write-Host "====================================================" -ForegroundColor Yellow
@@ -80,10 +270,30 @@ if ($originalFiles.Count -gt 0) {
     $originalFiles | Where-Object { $_ -match "auth|admin|config|env" } | Select-Object -First 5 | ForEach-Object { Write-Host " [FILE] $_" }
 }
 
-# 6. EXPORT RESULTS
+if ($null -ne $previous) {
+    Write-Host "`n[!] CHANGES SINCE LAST RUN ($($previous.date)):" -ForegroundColor Cyan
+    Write-Host "New Endpoints: $($newPaths.Count) | Removed: $($removedPaths.Count)"
+    $newPaths | Select-Object -First 10 | ForEach-Object { Write-Host " [NEW] $_" -ForegroundColor Green }
+    Write-Host "New Secrets:   $($newSecrets.Count) | Removed: $($removedSecrets.Count)"
+    $newSecrets | ForEach-Object { Write-Host " [NEW] $_" -ForegroundColor Red }
+} elseif ($isStreamingScan) {
+    Write-Host "`n[i] Streaming scan: changes since last run not tracked." -ForegroundColor Gray
+} else {
+    Write-Host "`n[i] No previous run of '$baselineName' in this folder. Baseline recorded." -ForegroundColor Gray
+}
+
+# 9. EXPORT RESULTS
 $originalFiles | Out-File -FilePath "audit_file_tree.txt"
 $allPaths      | Out-File -FilePath "audit_endpoints.txt"
 $secrets       | Out-File -FilePath "audit_secrets.txt"
 $todos         | Out-File -FilePath "audit_comments.txt"
 
+# Cleared when there is no baseline so another map's results aren't left behind.
+if ($null -ne $previous) {
+    $newPaths   | Out-File -FilePath "audit_new_endpoints.txt"
+    $newSecrets | Out-File -FilePath "audit_new_secrets.txt"
+} else {
+    Remove-Item -Path "audit_new_endpoints.txt", "audit_new_secrets.txt" -ErrorAction SilentlyContinue
+}
+
 Write-Host "`n[+] Audit results saved to your current folder." -ForegroundColor Green
\ No newline at end of file